@@ -2,19 +2,27 @@
 Obolus Core - Minimal protocol implementation for secure intent verification
 """
 
-from .shared import parse_challenge, format_message, create_response, display_challenge
-from .sign import sign_challenge, sign_challenge_to_json, load_private_key
-from .verify import verify_response, load_public_key, parse_response
+from .shared import Challenge, parse_challenge, format_message, create_response, display_challenge
+from .sign import (
+    sign_challenge, sign_challenge_to_json, sign_challenges_batch,
+    sign_challenges_batch_to_json, load_private_key
+)
+from .verify import Response, verify_response, verify_responses_batch, load_public_key, parse_response
 
 __all__ = [
+    'Challenge',
+    'Response',
     'parse_challenge',
     'format_message',
     'create_response',
     'display_challenge',
     'sign_challenge',
     'sign_challenge_to_json',
+    'sign_challenges_batch',
+    'sign_challenges_batch_to_json',
     'load_private_key',
     'verify_response',
+    'verify_responses_batch',
     'load_public_key',
     'parse_response'
 ]
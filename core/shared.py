@@ -8,44 +8,303 @@ import base64
 import os
 from datetime import datetime, timezone
 
-def parse_challenge(challenge_data):
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+def _loads(data):
+    """
+    Parse a JSON document from str or bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj, indent=None):
+    """
+    Serialize an object to a JSON string, using orjson when available.
+    
+    orjson only supports two-space indentation, so any other indent falls
+    back to the standard library. Both paths leave non-ASCII characters
+    unescaped, so write the result as UTF-8.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False)
+
+# Size of a bare Ed25519 key as written by keygen.py --raw; PEM files are
+# always longer
+_RAW_KEY_SIZE = 32
+
+def _read_key_file(key_path):
+    """
+    Read a key file with plain os-level calls.
+    
+    Key files are a few hundred bytes, so this skips the buffered file
+    object that open() would build around a single read.
+    """
+    fd = os.open(key_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 8192)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+def _parse_iso_utc(value):
+    """
+    Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC.
+    
+    JavaScript's toISOString() emits the 'Z' form, which
+    datetime.fromisoformat only understands from Python 3.11 on. The suffix
+    is handled here by slicing rather than str.replace, and the C parser
+    does the rest.
+    """
+    if value.endswith("Z"):
+        parsed = datetime.fromisoformat(value[:-1])
+        if parsed.tzinfo is not None:
+            raise ValueError(f"Invalid isoformat string: {value!r}")
+        return parsed.replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value)
+
+# Attribute assignment that bypasses _FieldMapping's immutability; only for
+# building instances and filling their lazy caches
+_set_slot = object.__setattr__
+
+class _FieldMapping:
+    """
+    Immutable, read-only dict interface over the FIELDS of a slotted class.
+    
+    Covers subscripting, membership, get(), iteration and keys()/values()/
+    items(), so dict(obj) works too. Instances compare equal to each other
+    and to plain dicts by their FIELDS, and repr() shows them. json.dumps()
+    still needs to_dict().
+    Attributes cannot be reassigned, which keeps values derived from the
+    fields (parsed timestamps, the message prefix) from going stale.
+    """
+    
+    __slots__ = ()
+    
+    FIELDS = ()
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __setstate__(self, state):
+        # Restore slots for pickle and copy, which would otherwise go
+        # through __setattr__
+        _, slots = state
+        for name, value in slots.items():
+            _set_slot(self, name, value)
+    
+    def to_dict(self):
+        """
+        Return the fields as a JSON-serializable dictionary.
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+    
+    def __eq__(self, other):
+        if isinstance(other, _FieldMapping):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+    
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in self.FIELDS
+    
+    def __iter__(self):
+        return iter(self.FIELDS)
+    
+    def __len__(self):
+        return len(self.FIELDS)
+    
+    def get(self, key, default=None):
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+    
+    def keys(self):
+        return list(self.FIELDS)
+    
+    def values(self):
+        return [getattr(self, field) for field in self.FIELDS]
+    
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.FIELDS]
+
+class Challenge(_FieldMapping):
+    """
+    A parsed challenge.
+    
+    Fields live in immutable slots rather than a dict. The read-only dict
+    interface (challenge["id"], "id" in challenge, challenge.get("id"),
+    dict(challenge)) still works for code written against the dict form, and
+    to_dict()/from_dict() convert to and from the JSON shape.
+    """
+    
+    FIELDS = ("id", "action", "timestamp", "nonce", "expires_at")
+    
+    __slots__ = FIELDS + ("timestamp_dt", "expires_at_dt", "_prefix")
+    
+    @classmethod
+    def from_dict(cls, data, timestamp_dt=None, expires_at_dt=None):
+        """
+        Build a challenge from a dictionary without validating it.
+        
+        Args:
+            data (dict): Challenge fields
+            timestamp_dt (datetime): Parsed timestamp, if already known
+            expires_at_dt (datetime): Parsed expires_at, if already known
+            
+        Returns:
+            Challenge: Challenge object
+            
+        Raises:
+            KeyError: If a required field is missing
+        """
+        challenge = cls.__new__(cls)
+        _set_slot(challenge, "id", data["id"])
+        _set_slot(challenge, "action", data["action"])
+        _set_slot(challenge, "timestamp", data["timestamp"])
+        _set_slot(challenge, "nonce", data["nonce"])
+        _set_slot(challenge, "expires_at", data["expires_at"])
+        _set_slot(challenge, "timestamp_dt", timestamp_dt)
+        _set_slot(challenge, "expires_at_dt", expires_at_dt)
+        _set_slot(challenge, "_prefix", None)
+        return challenge
+    
+    def message(self, response_action):
+        """
+        Return the signed message for a response to this challenge.
+        
+        Equivalent to format_message() on the challenge fields, but the
+        fixed "id:action:nonce:" prefix is built once per challenge.
+        
+        Args:
+            response_action (str): Response action ('approved' or 'rejected')
+            
+        Returns:
+            bytes: Encoded message ready for signing
+            
+        Raises:
+            ValueError: If the response action is invalid or the ID or nonce
+                contains ':'
+        """
+        validate_response_action(response_action)
+        if self._prefix is None:
+            _set_slot(self, "_prefix", _message_prefix(self.id, self.action, self.nonce))
+        return self._prefix + response_action.encode()
+
+def parse_challenge(challenge_data, validate=True):
     """
     Parse and validate challenge data.
     
     Args:
-        challenge_data (str or dict): Challenge data as JSON string or dictionary
+        challenge_data (str, bytes, dict or Challenge): Challenge data as JSON
+            text, dictionary or an already-parsed challenge
+        validate (bool): Whether to validate fields and timestamps. Pass False
+            only for challenges that were already validated upstream; they
+            are returned without parsed timestamps.
         
     Returns:
-        dict: Parsed challenge object
+        Challenge: Parsed challenge object. The parsed timestamps are kept on
+            timestamp_dt and expires_at_dt so later consumers do not re-parse
+            the ISO strings.
         
     Raises:
         ValueError: If challenge is invalid or missing required fields
     """
-    # Parse JSON if string is provided
-    if isinstance(challenge_data, str):
+    if isinstance(challenge_data, Challenge):
+        if validate and challenge_data.expires_at_dt is None:
+            challenge_data = challenge_data.to_dict()
+        else:
+            return challenge_data
+    
+    # Parse JSON unless an already-decoded dictionary is provided
+    if not isinstance(challenge_data, dict):
         try:
-            challenge = json.loads(challenge_data)
-        except json.JSONDecodeError as e:
+            challenge = _loads(challenge_data)
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid challenge JSON: {e}")
     else:
         challenge = challenge_data
     
+    if not validate:
+        try:
+            return Challenge.from_dict(challenge)
+        except KeyError as e:
+            raise ValueError(f"Challenge missing required field: {e.args[0]}")
+        except TypeError:
+            raise ValueError("Challenge must be a JSON object")
+    
     # Validate required fields
     required_fields = ["id", "action", "timestamp", "nonce", "expires_at"]
     for field in required_fields:
         if field not in challenge:
             raise ValueError(f"Challenge missing required field: {field}")
     
-    # Check expiration
+    # Parse expiration; whether an expired challenge is an error is up to
+    # the caller (verify_response reports it as EXPIRED)
     try:
-        expires_at = datetime.fromisoformat(challenge["expires_at"])
-        now = datetime.now(timezone.utc)
-        if now > expires_at:
-            print(f"Warning: Challenge has expired at {expires_at.isoformat()}")
+        expires_at = _parse_iso_utc(challenge["expires_at"])
     except ValueError as e:
         raise ValueError(f"Invalid expires_at format: {e}")
     
-    return challenge
+    try:
+        timestamp = _parse_iso_utc(challenge["timestamp"])
+    except ValueError as e:
+        raise ValueError(f"Invalid timestamp format: {e}")
+    
+    return Challenge.from_dict(challenge, timestamp, expires_at)
+
+def validate_response_action(response_action):
+    """
+    Check that a response action is one the protocol allows.
+    
+    Args:
+        response_action (str): Response action ('approved' or 'rejected')
+        
+    Raises:
+        ValueError: If the response action is invalid
+    """
+    if response_action not in ["approved", "rejected"]:
+        raise ValueError("Response action must be 'approved' or 'rejected'")
+
+def _message_prefix(challenge_id, action, nonce):
+    """
+    Build the "id:action:nonce:" part of the signed message, which is the
+    same for every response to a challenge.
+    """
+    # Fields are not length-prefixed, so only the action may contain the
+    # separator; a ':' in the ID or nonce would make the message ambiguous
+    if ":" in challenge_id or ":" in nonce:
+        raise ValueError("Challenge ID and nonce must not contain ':'")
+    
+    return b":".join((
+        challenge_id.encode(),
+        action.encode(),
+        nonce.encode(),
+        b""
+    ))
 
 def format_message(challenge_id, action, nonce, response_action):
     """
@@ -59,14 +318,15 @@ def format_message(challenge_id, action, nonce, response_action):
         
     Returns:
         bytes: Encoded message ready for signing
+        
+    Raises:
+        ValueError: If the response action is invalid or the ID or nonce
+            contains ':'
     """
-    if response_action not in ["approved", "rejected"]:
-        raise ValueError("Response action must be 'approved' or 'rejected'")
-    
-    message = f"{challenge_id}:{action}:{nonce}:{response_action}"
-    return message.encode()
+    validate_response_action(response_action)
+    return _message_prefix(challenge_id, action, nonce) + response_action.encode()
 
-def create_response(challenge_id, response_action, signature):
+def create_response(challenge_id, response_action, signature, timestamp=None):
     """
     Create a response object.
     
@@ -74,15 +334,20 @@ def create_response(challenge_id, response_action, signature):
         challenge_id (str): Challenge ID
         response_action (str): Response action ('approved' or 'rejected')
         signature (bytes): Raw signature bytes
+        timestamp (str): ISO-8601 response timestamp (default: now). Batch
+            signers pass one value for the whole batch.
         
     Returns:
         dict: Response object
     """
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+    
     return {
         "id": challenge_id,
         "response": response_action,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "signature": base64.b64encode(signature).decode("utf-8")
+        "timestamp": timestamp,
+        "signature": base64.b64encode(signature).decode("ascii")
     }
 
 def display_challenge(challenge):
@@ -90,14 +355,17 @@ def display_challenge(challenge):
     Display challenge information in a human-readable format.
     
     Args:
-        challenge (dict): Challenge object
+        challenge (dict or Challenge): Challenge object
     """
+    if not isinstance(challenge, Challenge):
+        challenge = Challenge.from_dict(challenge)
+    
     print("\n===== OBOLUS CHALLENGE =====")
-    print(f"Action: {challenge['action']}")
-    print(f"ID: {challenge['id']}")
+    print(f"Action: {challenge.action}")
+    print(f"ID: {challenge.id}")
 
-    created_at = datetime.fromisoformat(challenge["timestamp"])
-    expires_at = datetime.fromisoformat(challenge["expires_at"])
+    created_at = challenge.timestamp_dt or _parse_iso_utc(challenge.timestamp)
+    expires_at = challenge.expires_at_dt or _parse_iso_utc(challenge.expires_at)
 
     print(f"Created: {created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print(f"Expires: {expires_at.strftime('%Y-%m-%d %H:%M:%S UTC')}")
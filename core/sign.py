@@ -3,17 +3,42 @@
 Obolus core signing module - sign challenges with Ed25519 private keys.
 """
 
-import json
 import base64
+import binascii
+import os
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 
 # Import shared functions
-from .shared import parse_challenge, format_message, create_response
+from .shared import (
+    parse_challenge, create_response, validate_response_action,
+    _dumps, _read_key_file, _RAW_KEY_SIZE
+)
+
+@functools.lru_cache(maxsize=8)
+def _load_private_key_cached(key_path, mtime_ns):
+    """
+    Parse a PEM or raw 32-byte private key file; cached per (path,
+    modification time).
+    """
+    key_data = _read_key_file(key_path)
+    if len(key_data) == _RAW_KEY_SIZE:
+        return ed25519.Ed25519PrivateKey.from_private_bytes(key_data)
+    return serialization.load_pem_private_key(
+        key_data,
+        password=None
+    )
 
 def load_private_key(key_path):
     """
-    Load an Ed25519 private key from a file.
+    Load an Ed25519 private key from a PEM file or a raw 32-byte seed file.
+    
+    Parsed keys are cached by path and modification time, so repeated calls
+    are cheap and a rotated key file is picked up automatically.
     
     Args:
         key_path (str): Path to the private key file
@@ -25,19 +50,27 @@ def load_private_key(key_path):
         Exception: If key loading fails
     """
     try:
-        with open(key_path, "rb") as key_file:
-            private_key = serialization.load_pem_private_key(
-                key_file.read(),
-                password=None
-            )
-        return private_key
+        return _load_private_key_cached(key_path, os.stat(key_path).st_mtime_ns)
     except Exception as e:
         raise Exception(f"Error loading private key: {e}")
         
+@functools.lru_cache(maxsize=8)
+def _load_der_private_key_cached(key_bytes):
+    """
+    Parse a DER private key; cached per decoded key bytes.
+    """
+    return serialization.load_der_private_key(
+        key_bytes,
+        password=None
+    )
+
 def load_private_key_from_base64(base64_key):
     """
     Load an Ed25519 private key from a base64 string.
     
+    Parsed keys are cached by their decoded bytes, so a server that receives
+    the same key on every request only pays for the DER parse once.
+    
     Args:
         base64_key (str): Base64-encoded private key
         
@@ -52,26 +85,30 @@ def load_private_key_from_base64(base64_key):
         if not base64_key or len(base64_key.strip()) == 0:
             raise ValueError("Empty base64 key provided")
             
-        # Simple pattern check for base64 string (optional)
-        import re
-        if not re.match(r'^[A-Za-z0-9+/]+={0,2}$', base64_key.strip()):
+        # validate=True rejects non-alphabet characters during the decode
+        try:
+            key_bytes = base64.b64decode(base64_key.strip(), validate=True)
+        except binascii.Error:
             raise ValueError("Input does not appear to be valid base64")
             
-        key_bytes = base64.b64decode(base64_key)
-        private_key = serialization.load_der_private_key(
-            key_bytes,
-            password=None
-        )
-        return private_key
+        return _load_der_private_key_cached(key_bytes)
     except Exception as e:
         raise Exception(f"Error loading private key from base64: {e}")
 
+def _load_signing_key(private_key_source, is_base64):
+    """
+    Load a private key from a file path or a base64 string.
+    """
+    if is_base64:
+        return load_private_key_from_base64(private_key_source)
+    return load_private_key(private_key_source)
+
 def sign_challenge(challenge_data, private_key_source, response_action="approved", is_base64=False):
     """
     Sign a challenge with an Ed25519 private key.
     
     Args:
-        challenge_data (str or dict): Challenge data as JSON string or dictionary
+        challenge_data (str, bytes or dict): Challenge data as JSON text or dictionary
         private_key_source (str): Path to private key file or base64-encoded key
         response_action (str): Response action ('approved' or 'rejected')
         is_base64 (bool): Whether private_key_source is a base64 string
@@ -87,32 +124,29 @@ def sign_challenge(challenge_data, private_key_source, response_action="approved
     challenge = parse_challenge(challenge_data)
     
     # Load private key
-    if is_base64:
-        private_key = load_private_key_from_base64(private_key_source)
-    else:
-        private_key = load_private_key(private_key_source)
+    private_key = _load_signing_key(private_key_source, is_base64)
     
     # Format message and sign
-    message = format_message(
-        challenge["id"], 
-        challenge["action"], 
-        challenge["nonce"], 
-        response_action
-    )
+    message = challenge.message(response_action)
     signature = private_key.sign(message)
     
     # Create response
-    return create_response(challenge["id"], response_action, signature)
+    return create_response(challenge.id, response_action, signature)
 
-def sign_challenge_to_json(challenge_data, private_key_source, response_action="approved", is_base64=False):
+def sign_challenge_to_json(challenge_data, private_key_source, response_action="approved", is_base64=False, indent=None):
     """
     Sign a challenge and return the response as a JSON string.
     
+    The output is compact by default since responses are usually consumed
+    by machines; pass indent=2 for the pretty-printed form earlier versions
+    always produced.
+    
     Args:
-        challenge_data (str or dict): Challenge data as JSON string or dictionary
+        challenge_data (str, bytes or dict): Challenge data as JSON text or dictionary
         private_key_source (str): Path to private key file or base64-encoded key
         response_action (str): Response action ('approved' or 'rejected')
         is_base64 (bool): Whether private_key_source is a base64 string
+        indent (int): Indentation level for pretty-printing (default: compact)
         
     Returns:
         str: JSON string of the signed response
@@ -122,4 +156,118 @@ def sign_challenge_to_json(challenge_data, private_key_source, response_action="
         Exception: If signing fails
     """
     response = sign_challenge(challenge_data, private_key_source, response_action, is_base64)
-    return json.dumps(response, indent=2)
\ No newline at end of file
+    return _dumps(response, indent=indent)
+
+# Smallest batch worth handing to a process pool; below this, worker
+# start-up costs more than signing in-process
+_PARALLEL_THRESHOLD = 256
+
+# Private key held by each process-pool worker, set by _init_worker
+_worker_private_key = None
+
+def _init_worker(private_key_source, is_base64):
+    """
+    Load the private key once per process-pool worker.
+    """
+    global _worker_private_key
+    _worker_private_key = _load_signing_key(private_key_source, is_base64)
+
+def _sign_with_key(private_key, challenge_data, response_action, timestamp, validate=True):
+    """
+    Parse, format and sign a single challenge with an already-loaded key.
+    """
+    challenge = parse_challenge(challenge_data, validate)
+    message = challenge.message(response_action)
+    signature = private_key.sign(message)
+    return create_response(challenge.id, response_action, signature, timestamp)
+
+def _sign_in_worker(challenge_data, response_action, timestamp):
+    """
+    Sign a single challenge with the key loaded by _init_worker.
+    """
+    return _sign_with_key(_worker_private_key, challenge_data, response_action, timestamp, False)
+
+def sign_challenges_batch(challenges, private_key_source, response_action="approved", is_base64=False, workers=1):
+    """
+    Sign many challenges with the same Ed25519 private key.
+    
+    The key is loaded once and every response shares a single timestamp,
+    so this is the preferred path when signing four or more challenges.
+    Only the first challenge is fully validated; the batch is expected to
+    come from a trusted source such as a server that already checked it.
+    Later challenges are only checked for the required fields, so a
+    malformed one still raises ValueError partway through the batch.
+    
+    With workers > 1, batches of at least a few hundred challenges are
+    signed across a process pool. Smaller batches are always signed
+    in-process since pool start-up would outweigh the signing work.
+    
+    Args:
+        challenges (iterable): Challenges as JSON text or dictionaries
+        private_key_source (str): Path to private key file or base64-encoded key
+        response_action (str): Response action ('approved' or 'rejected')
+        is_base64 (bool): Whether private_key_source is a base64 string
+        workers (int): Number of worker processes to sign with
+        
+    Returns:
+        list: Signed response objects, in input order
+        
+    Raises:
+        ValueError: If the first challenge is invalid, a later challenge is
+            not a JSON object or is missing a field, or response action is
+            invalid
+        Exception: If signing fails
+    """
+    # Fail fast on a bad action before loading keys or starting workers
+    validate_response_action(response_action)
+    
+    challenges = list(challenges)
+    if challenges:
+        # Validate the first challenge as a sanity check on the batch; the
+        # rest are trusted to have the same shape
+        parse_challenge(challenges[0])
+    
+    private_key = _load_signing_key(private_key_source, is_base64)
+    timestamp = datetime.now(timezone.utc).isoformat()
+    
+    if workers > 1 and len(challenges) >= _PARALLEL_THRESHOLD:
+        chunksize = max(1, len(challenges) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(private_key_source, is_base64)
+        ) as pool:
+            return list(pool.map(
+                _sign_in_worker,
+                challenges,
+                itertools.repeat(response_action),
+                itertools.repeat(timestamp),
+                chunksize=chunksize
+            ))
+    
+    return [
+        _sign_with_key(private_key, challenge_data, response_action, timestamp, False)
+        for challenge_data in challenges
+    ]
+
+def sign_challenges_batch_to_json(challenges, private_key_source, response_action="approved", is_base64=False, workers=1, indent=None):
+    """
+    Sign many challenges and return the responses as a JSON array string.
+    
+    Args:
+        challenges (iterable): Challenges as JSON text or dictionaries
+        private_key_source (str): Path to private key file or base64-encoded key
+        response_action (str): Response action ('approved' or 'rejected')
+        is_base64 (bool): Whether private_key_source is a base64 string
+        workers (int): Number of worker processes to sign with
+        indent (int): Indentation level for pretty-printing (default: compact)
+        
+    Returns:
+        str: JSON string of the signed responses
+        
+    Raises:
+        ValueError: If a challenge is invalid or response action is invalid
+        Exception: If signing fails
+    """
+    responses = sign_challenges_batch(challenges, private_key_source, response_action, is_base64, workers)
+    return _dumps(responses, indent=indent)
\ No newline at end of file
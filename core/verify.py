@@ -3,19 +3,41 @@
 Obolus core verification module - verify signatures with Ed25519 public keys.
 """
 
-import json
 import base64
+import binascii
+import os
+import functools
 from datetime import datetime, timezone, timedelta
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 from cryptography.exceptions import InvalidSignature
 
 # Import shared functions
-from .shared import parse_challenge, format_message
+from .shared import (
+    parse_challenge, _loads, _parse_iso_utc, _read_key_file,
+    _RAW_KEY_SIZE, _FieldMapping, _set_slot
+)
+
+# Allowed clock drift for response timestamps ahead of the verifier's clock
+_CLOCK_DRIFT_TOLERANCE = timedelta(minutes=5)
+
+@functools.lru_cache(maxsize=8)
+def _load_public_key_cached(key_path, mtime_ns):
+    """
+    Parse a PEM or raw 32-byte public key file; cached per (path,
+    modification time).
+    """
+    key_data = _read_key_file(key_path)
+    if len(key_data) == _RAW_KEY_SIZE:
+        return ed25519.Ed25519PublicKey.from_public_bytes(key_data)
+    return serialization.load_pem_public_key(key_data)
 
 def load_public_key(key_path):
     """
-    Load an Ed25519 public key from a file.
+    Load an Ed25519 public key from a PEM file or a raw 32-byte key file.
+    
+    Parsed keys are cached by path and modification time, so repeated calls
+    are cheap and a rotated key file is picked up automatically.
     
     Args:
         key_path (str): Path to the public key file
@@ -27,30 +49,67 @@ def load_public_key(key_path):
         Exception: If key loading fails
     """
     try:
-        with open(key_path, "rb") as key_file:
-            public_key = serialization.load_pem_public_key(key_file.read())
-        return public_key
+        return _load_public_key_cached(key_path, os.stat(key_path).st_mtime_ns)
     except Exception as e:
         raise Exception(f"Error loading public key: {e}")
 
+class Response(_FieldMapping):
+    """
+    A parsed response.
+    
+    Fields live in immutable slots rather than a dict. The read-only dict
+    interface (response["id"], "id" in response, response.get("id"),
+    dict(response)) still works for code written against the dict form, and
+    to_dict()/from_dict() convert to and from the JSON shape.
+    """
+    
+    FIELDS = ("id", "response", "timestamp", "signature")
+    
+    __slots__ = FIELDS
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a response from a dictionary without validating it.
+        
+        Args:
+            data (dict): Response fields
+            
+        Returns:
+            Response: Response object
+            
+        Raises:
+            KeyError: If a required field is missing
+        """
+        response = cls.__new__(cls)
+        _set_slot(response, "id", data["id"])
+        _set_slot(response, "response", data["response"])
+        _set_slot(response, "timestamp", data["timestamp"])
+        _set_slot(response, "signature", data["signature"])
+        return response
+
 def parse_response(response_data):
     """
     Parse and validate response data.
     
     Args:
-        response_data (str or dict): Response data as JSON string or dictionary
+        response_data (str, bytes, dict or Response): Response data as JSON
+            text, dictionary or an already-parsed response
         
     Returns:
-        dict: Parsed response object
+        Response: Parsed response object
         
     Raises:
         ValueError: If response is invalid or missing required fields
     """
-    # Parse JSON if string is provided
-    if isinstance(response_data, str):
+    if isinstance(response_data, Response):
+        response_data = response_data.to_dict()
+    
+    # Parse JSON unless an already-decoded dictionary is provided
+    if not isinstance(response_data, dict):
         try:
-            response = json.loads(response_data)
-        except json.JSONDecodeError as e:
+            response = _loads(response_data)
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid response JSON: {e}")
     else:
         response = response_data
@@ -65,23 +124,22 @@ def parse_response(response_data):
     if response["response"] not in ["approved", "rejected"]:
         raise ValueError("Response action must be 'approved' or 'rejected'")
     
-    return response
+    return Response.from_dict(response)
 
-def verify_response(challenge_data, response_data, public_key_path):
+def _prepare_verification(challenge_data, response_data):
     """
-    Verify a response against a challenge using an Ed25519 public key.
+    Run every check that precedes the signature verification itself.
+    
+    Cheap checks run first so that expired or malformed responses are
+    rejected before any public key is loaded.
     
     Args:
-        challenge_data (str or dict): Challenge data as JSON string or dictionary
-        response_data (str or dict): Response data as JSON string or dictionary
-        public_key_path (str): Path to the public key file
+        challenge_data (str, bytes or dict): Challenge data as JSON text or dictionary
+        response_data (str, bytes or dict): Response data as JSON text or dictionary
         
     Returns:
-        tuple: (bool, str) - (Success, Status message)
-        
-    Raises:
-        ValueError: If challenge or response is invalid
-        Exception: If verification fails due to system errors
+        tuple: (message, signature, status) - message and signature are the
+            bytes to verify, or None with status holding the failure message
     """
     try:
         # Parse and validate challenge and response
@@ -89,56 +147,115 @@ def verify_response(challenge_data, response_data, public_key_path):
         response = parse_response(response_data)
         
         # Check if response ID matches challenge ID
-        if response["id"] != challenge["id"]:
-            return False, "Response ID does not match challenge ID"
+        if response.id != challenge.id:
+            return None, None, "Response ID does not match challenge ID"
+        
+        # Check if challenge has expired - ENHANCED EXPIRATION HANDLING
+        now = datetime.now(timezone.utc)
+        if now > challenge.expires_at_dt:
+            # Return a specific status code/message for expired challenges
+            return None, None, "EXPIRED"  # Use a consistent code that can be checked
         
         # Add timestamp validation
         try:
-            challenge_time = datetime.fromisoformat(challenge["timestamp"])
-            response_time = datetime.fromisoformat(response["timestamp"])
-            now = datetime.now(timezone.utc)
+            challenge_time = challenge.timestamp_dt
+            response_time = _parse_iso_utc(response.timestamp)
     
             # Response should be after challenge was created
             if response_time < challenge_time:
-                return False, "Response timestamp predates challenge creation"
+                return None, None, "Response timestamp predates challenge creation"
         
             # Response shouldn't be from the future (with small tolerance)
-            tolerance = timedelta(minutes=5)  # Allow for clock drift
-            if response_time > now + tolerance:
-                return False, "Response timestamp is from the future"
+            if response_time > now + _CLOCK_DRIFT_TOLERANCE:
+                return None, None, "Response timestamp is from the future"
         except ValueError as e:
-            return False, f"Invalid timestamp format: {e}"
+            return None, None, f"Invalid timestamp format: {e}"
         
-        # Check if challenge has expired - ENHANCED EXPIRATION HANDLING
-        expires_at = datetime.fromisoformat(challenge["expires_at"])
-        now = datetime.now(timezone.utc)
-        if now > expires_at:
-            # Return a specific status code/message for expired challenges
-            return False, "EXPIRED"  # Use a consistent code that can be checked
+        # Format message that was signed
+        message = challenge.message(response.response)
         
+        # Decode signature; validate=True rejects non-alphabet characters
+        # instead of silently discarding them
+        try:
+            signature = base64.b64decode(response.signature, validate=True)
+        except (binascii.Error, ValueError, TypeError) as e:
+            return None, None, f"Invalid signature encoding: {e}"
+        
+        return message, signature, response.response
+        
+    except Exception as e:
+        return None, None, f"Verification error: {e}"
+
+def verify_response(challenge_data, response_data, public_key_path):
+    """
+    Verify a response against a challenge using an Ed25519 public key.
+    
+    Args:
+        challenge_data (str, bytes or dict): Challenge data as JSON text or dictionary
+        response_data (str, bytes or dict): Response data as JSON text or dictionary
+        public_key_path (str): Path to the public key file
+        
+    Returns:
+        tuple: (bool, str) - (Success, Status message)
+        
+    Raises:
+        ValueError: If challenge or response is invalid
+        Exception: If verification fails due to system errors
+    """
+    message, signature, status = _prepare_verification(challenge_data, response_data)
+    if message is None:
+        return False, status
+    
+    try:
         # Load public key
         public_key = load_public_key(public_key_path)
         
-        # Format message that was signed
-        message = format_message(
-            challenge["id"], 
-            challenge["action"], 
-            challenge["nonce"], 
-            response["response"]
-        )
-        
-        # Decode signature
-        try:
-            signature = base64.b64decode(response["signature"])
-        except Exception as e:
-            return False, f"Invalid signature encoding: {e}"
-        
         # Verify signature
         try:
             public_key.verify(signature, message)
-            return True, response["response"]
+            return True, status
         except InvalidSignature:
             return False, "Invalid signature"
             
     except Exception as e:
-        return False, f"Verification error: {e}"
\ No newline at end of file
+        return False, f"Verification error: {e}"
+
+def verify_responses_batch(pairs, public_key_path):
+    """
+    Verify many responses against the same Ed25519 public key.
+    
+    The public key is loaded once for the whole batch instead of once per
+    response, so this is the preferred path for servers handling several
+    responses at a time.
+    
+    Args:
+        pairs (iterable): (challenge_data, response_data) tuples, each as
+            JSON strings or dictionaries
+        public_key_path (str): Path to the public key file
+        
+    Returns:
+        list: (bool, str) tuples, one per pair, in input order
+    """
+    pairs = list(pairs)
+    if len(pairs) == 1:
+        return [verify_response(pairs[0][0], pairs[0][1], public_key_path)]
+    
+    # Loaded on the first response that passes the cheap checks
+    public_key = None
+    results = []
+    for challenge_data, response_data in pairs:
+        message, signature, status = _prepare_verification(challenge_data, response_data)
+        if message is None:
+            results.append((False, status))
+            continue
+        try:
+            if public_key is None:
+                public_key = load_public_key(public_key_path)
+            public_key.verify(signature, message)
+            results.append((True, status))
+        except InvalidSignature:
+            results.append((False, "Invalid signature"))
+        except Exception as e:
+            results.append((False, f"Verification error: {e}"))
+    
+    return results
\ No newline at end of file
@@ -3,18 +3,24 @@
 Obolus Backend Example
 
 A simple FastAPI implementation showcasing how to use Obolus for challenge-response authentication.
-This provides two main endpoints:
+This provides three main endpoints:
 - POST /challenge - Generate a new challenge
 - POST /verify - Verify a response against a challenge
+- POST /verify_batch - Verify many responses in one request
 """
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from cryptography.exceptions import InvalidSignature
 import os
 import sys
-import json
-from typing import Dict, Any, Tuple, Optional
+import base64
+import asyncio
+import functools
+from typing import Dict, Any, List, Tuple, Optional
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 # Add parent directory to path so we can import core modules
@@ -22,15 +28,24 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 # Import obolus modules
 try:
-    from core.shared import parse_challenge
     from tools.challenge_gen import generate_challenge
-    from core.verify import verify_response
+    from core.verify import verify_response, load_public_key, _prepare_verification
 except ImportError:
     print("Error: Could not import Obolus modules.")
     print("Make sure this script is run from the Obolus directory.")
     sys.exit(1)
 
-app = FastAPI(title="Obolus Demo API")
+# Server-side public key, used when a verify request doesn't carry its own
+PUBLIC_KEY_PATH = os.getenv("OBOLUS_PUBLIC_KEY", "data/keys/public_key.pem")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-load the server key so the first request doesn't pay for the parse
+    if os.path.exists(PUBLIC_KEY_PATH):
+        load_public_key(PUBLIC_KEY_PATH)
+    yield
+
+app = FastAPI(title="Obolus Demo API", lifespan=lifespan)
 
 # Add CORS middleware to allow browser requests
 app.add_middleware(
@@ -49,10 +64,23 @@ class ChallengeRequest(BaseModel):
 class VerifyRequest(BaseModel):
     challenge: Dict[str, Any]
     response: Dict[str, Any]
-    public_key: str
+    public_key: Optional[str] = None  # Base64 raw key; defaults to the server key
+
+# Response models let FastAPI serialize results straight to JSON bytes
+# through Pydantic instead of the generic jsonable_encoder + json.dumps path
+class ChallengeResponse(BaseModel):
+    id: str
+    action: str
+    timestamp: str
+    nonce: str
+    expires_at: str
+
+class VerifyResult(BaseModel):
+    verified: bool
+    status: str
 
 # Endpoint to generate a challenge
-@app.post("/challenge")
+@app.post("/challenge", response_model=ChallengeResponse)
 async def create_challenge(request: ChallengeRequest):
     """
     Generate a new Obolus challenge for the specified action.
@@ -63,77 +91,128 @@ async def create_challenge(request: ChallengeRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating challenge: {str(e)}")
 
-# Endpoint to verify a response
-@app.post("/verify")
-async def verify_challenge_response(request: VerifyRequest):
+@functools.lru_cache(maxsize=256)
+def _load_public_key_b64(public_key_b64: str):
     """
-    Verify a signed response against a challenge.
-    Returns whether verification was successful and the status.
+    Decode a base64 raw Ed25519 public key; cached so returning clients
+    skip the decode and key construction.
     """
-    try:
-        # Convert objects to JSON strings
-        challenge_json = json.dumps(request.challenge)
-        response_json = json.dumps(request.response)
-        
-        import base64
-        from cryptography.hazmat.primitives.asymmetric import ed25519
-        from core.shared import parse_challenge, format_message
-        from core.verify import parse_response
-
-
-        try:
-            # Load public key from request
-            public_key_bytes = base64.b64decode(request.public_key)
-            public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
-
-            # Parse challenge and response
-            challenge = parse_challenge(request.challenge)
-            response = parse_response(request.response)
-
-            # Format the original message string
-            message = format_message(
-                challenge["id"],
-                challenge["action"],
-                challenge["nonce"],
-                response["response"]
-            )
-
-            # Decode signature and verify
-            signature = base64.b64decode(response["signature"])
-            public_key.verify(signature, message)
+    # validate=True rejects non-alphabet characters, as core does
+    public_key_bytes = base64.b64decode(public_key_b64, validate=True)
+    return ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
 
+def _verify_request(request: VerifyRequest) -> Dict[str, Any]:
+    """
+    Verify a single signed response.
+    
+    Both key sources go through core's checks (matching ID, expiry,
+    timestamps and strict base64), so an expired or replayed approval is
+    rejected whichever key it is checked against.
+    """
+    try:
+        # No key in the request: verify against the server key
+        if not request.public_key:
+            verified, status = verify_response(request.challenge, request.response, PUBLIC_KEY_PATH)
             return {
-                "verified": True,
-                "status": response["response"]
+                "verified": verified,
+                "status": status
             }
 
-        except Exception as e:
+        # Run the checks that precede the signature verification
+        message, signature, status = _prepare_verification(request.challenge, request.response)
+        if message is None:
             return {
                 "verified": False,
-                "status": f"Invalid signature: {str(e)}"
-            }   
+                "status": status
+            }
+
+        # Verify against the key supplied with the request
+        public_key = _load_public_key_b64(request.public_key)
+        public_key.verify(signature, message)
+
+        return {
+            "verified": True,
+            "status": status
+        }
+
+    except InvalidSignature:
+        return {
+            "verified": False,
+            "status": "Invalid signature"
+        }
+    except Exception as e:
+        return {
+            "verified": False,
+            "status": f"Verification error: {str(e)}"
+        }
+
+# Endpoint to verify a response
+@app.post("/verify", response_model=VerifyResult)
+async def verify_challenge_response(request: VerifyRequest):
+    """
+    Verify a signed response against a challenge.
+    Returns whether verification was successful and the status.
+    """
+    try:
+        # Parsing and the Ed25519 check are synchronous; run them off the
+        # event loop so other connections are served meanwhile
+        return await asyncio.to_thread(_verify_request, request)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error verifying response: {str(e)}")
 
+# Endpoint to verify many responses at once
+@app.post("/verify_batch", response_model=List[VerifyResult])
+async def verify_challenge_responses(requests: List[VerifyRequest]):
+    """
+    Verify a list of signed responses against their challenges.
+    Returns one result per request, in order; a bad signature only fails
+    its own entry.
+    """
+    try:
+        return await asyncio.to_thread(
+            lambda: [_verify_request(request) for request in requests]
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error verifying responses: {str(e)}")
+
 # Endpoint to get server info
 @app.get("/info")
 async def get_server_info():
     """
     Get information about this Obolus server.
     """
-    public_key_path = os.getenv("OBOLUS_PUBLIC_KEY", "data/keys/public_key.pem")
-    
     return {
         "name": "Obolus Demo Server",
         "version": "1.0.0",
-        "public_key_path": public_key_path,
-        "public_key_exists": os.path.exists(public_key_path),
+        "public_key_path": PUBLIC_KEY_PATH,
+        "public_key_exists": os.path.exists(PUBLIC_KEY_PATH),
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 if __name__ == "__main__":
+    import argparse
     import uvicorn
+
+    parser = argparse.ArgumentParser(description="Obolus Demo API")
+    parser.add_argument("--dev", action="store_true",
+                        help="Run a single auto-reloading worker for development")
+    args = parser.parse_args()
+
     print("Starting Obolus Demo API...")
     print("Make sure you've generated keys with: python tools/keygen.py --output-dir data/keys")
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+
+    # Reload and multiple workers both need the app as an import string
+    if args.dev:
+        uvicorn.run("examples.backend_example:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # loop/http "auto" pick uvloop and httptools when they are installed
+        uvicorn.run(
+            "examples.backend_example:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=os.cpu_count(),
+            loop="auto",
+            http="auto"
+        )
@@ -18,6 +18,10 @@ CHALLENGE_FILE="$TEST_DIR/challenge.json"
 RESPONSE_FILE="$TEST_DIR/response.json"
 PRIVATE_KEY="$TEST_DIR/private_key.pem"
 PUBLIC_KEY="$TEST_DIR/public_key.pem"
+RAW_RESPONSE_FILE="$TEST_DIR/response_raw.json"
+RAW_PRIVATE_KEY="$TEST_DIR/private_key.raw"
+RAW_PUBLIC_KEY="$TEST_DIR/public_key.raw"
+BATCH_DIR="$TEST_DIR/batch"
 
 # Clean up on exit (comment this out for debugging)
 # trap 'rm -rf "$TEST_DIR"' EXIT
@@ -45,6 +49,49 @@ else
     exit 1
 fi
 
+# Step 5: Raw 32-byte key round trip
+echo "[5] Generating raw keys..."
+python tools/keygen.py --raw --output-dir "$TEST_DIR"
+for key in "$RAW_PRIVATE_KEY" "$RAW_PUBLIC_KEY"; do
+    size=$(wc -c < "$key" | tr -d ' ')
+    if [ "$size" != "32" ]; then
+        echo -e "\n❌ FAILURE: $key is $size bytes, expected 32!"
+        exit 1
+    fi
+done
+
+echo "[6] Signing with the raw key (pretty-printed)..."
+python tools/obolus_sign.py --key "$RAW_PRIVATE_KEY" --challenge "$CHALLENGE_FILE" --output "$RAW_RESPONSE_FILE" --pretty
+if [ "$(wc -l < "$RAW_RESPONSE_FILE" | tr -d ' ')" -lt 2 ]; then
+    echo -e "\n❌ FAILURE: --pretty did not produce indented JSON!"
+    exit 1
+fi
+
+echo "[7] Verifying with the raw key..."
+if python tools/obolus_verify.py --key "$RAW_PUBLIC_KEY" --challenge "$CHALLENGE_FILE" --response "$RAW_RESPONSE_FILE"; then
+    echo -e "\n✅ SUCCESS: Raw key response verified!"
+else
+    echo -e "\n❌ FAILURE: Raw key verification failed!"
+    exit 1
+fi
+
+echo "[8] Checking that the PEM public key rejects the raw key's signature..."
+if python tools/obolus_verify.py --key "$PUBLIC_KEY" --challenge "$CHALLENGE_FILE" --response "$RAW_RESPONSE_FILE"; then
+    echo -e "\n❌ FAILURE: Response verified against the wrong key!"
+    exit 1
+fi
+
+# Step 9: Batch key generation
+echo "[9] Generating a batch of 3 key pairs..."
+python tools/keygen.py --batch 3 --output-dir "$BATCH_DIR"
+for keys in "$BATCH_DIR/private_keys.jsonl" "$BATCH_DIR/public_keys.jsonl"; do
+    count=$(wc -l < "$keys" | tr -d ' ')
+    if [ "$count" != "3" ]; then
+        echo -e "\n❌ FAILURE: $keys has $count lines, expected 3!"
+        exit 1
+    fi
+done
+
 echo -e "\nTest completed successfully!"
 echo "Test artifacts are in: $TEST_DIR"
 echo "You can examine them for debugging or delete the directory when done."
@@ -3,14 +3,40 @@
 Obolus challenge generator - creates challenge objects for Obolus authentication.
 """
 
-import json
 import uuid
 import base64
 import os
 import sys  # Add this import
 import argparse
+import threading
 from datetime import datetime, timedelta, timezone
 
+class _RandomPool:
+    """
+    Hand out random bytes from a buffer refilled by one os.urandom call,
+    instead of one getrandom syscall per ID and nonce. The buffer is
+    dropped after a fork so parent and child never hand out the same bytes.
+    """
+    
+    def __init__(self, size=4096):
+        self._size = size
+        self._buffer = b""
+        self._offset = 0
+        self._pid = None
+        self._lock = threading.Lock()
+    
+    def take(self, n):
+        with self._lock:
+            if self._pid != os.getpid() or self._offset + n > len(self._buffer):
+                self._buffer = os.urandom(self._size)
+                self._offset = 0
+                self._pid = os.getpid()
+            chunk = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+            return chunk
+
+_random_pool = _RandomPool()
+
 def generate_challenge(action, expiry_seconds=60):
     """
     Generate a new Obolus challenge.
@@ -22,10 +48,10 @@ def generate_challenge(action, expiry_seconds=60):
     Returns:
         dict: Challenge object
     """
-    challenge_id = str(uuid.uuid4())
+    challenge_id = str(uuid.UUID(bytes=_random_pool.take(16), version=4))
     now = datetime.now(timezone.utc)
     expires_at = now + timedelta(seconds=expiry_seconds)
-    nonce = base64.b64encode(os.urandom(16)).decode('utf-8')
+    nonce = base64.b64encode(_random_pool.take(16)).decode('ascii')
     
     challenge = {
         "id": challenge_id,
@@ -38,6 +64,17 @@ def generate_challenge(action, expiry_seconds=60):
     return challenge
 
 def main():
+    # Imported here rather than at module level so that importing
+    # generate_challenge as a library neither touches sys.path nor exits
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    
+    try:
+        from core.shared import _dumps
+    except ImportError:
+        print("Error: Could not import core modules.")
+        print("Make sure this script is run from the obolus directory or the core modules are in your Python path.")
+        return 1
+    
     parser = argparse.ArgumentParser(description="Generate Obolus authentication challenges")
     parser.add_argument("action", help="Action being authenticated (e.g., 'login', 'transfer_funds')")
     parser.add_argument("--expiry", type=int, default=60, help="Expiry time in seconds (default: 60)")
@@ -48,11 +85,13 @@ def main():
     try:
         # Generate challenge
         challenge = generate_challenge(args.action, args.expiry)
-        challenge_json = json.dumps(challenge, indent=2)
+        challenge_json = _dumps(challenge, indent=2)
         
         # Output result
         if args.output:
-            with open(args.output, 'w') as f:
+            # orjson writes non-ASCII as raw UTF-8, so don't rely on the
+            # locale encoding
+            with open(args.output, 'w', encoding='utf-8') as f:
                 f.write(challenge_json)
             print(f"Challenge saved to {args.output}")
         else:
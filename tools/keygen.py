@@ -7,9 +7,11 @@ from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 import os
 import sys  # Add this import
+import json
+import base64
 import argparse
 
-def generate_keys(output_dir=None, private_key_name="private_key.pem", public_key_name="public_key.pem"):
+def generate_keys(output_dir=None, private_key_name="private_key.pem", public_key_name="public_key.pem", raw=False):
     """
     Generate Ed25519 key pair for Obolus and save to files.
     
@@ -17,6 +19,9 @@ def generate_keys(output_dir=None, private_key_name="private_key.pem", public_ke
         output_dir (str): Directory to save keys (default: current directory)
         private_key_name (str): Filename for private key
         public_key_name (str): Filename for public key
+        raw (bool): Write bare 32-byte keys instead of PEM. The core loaders
+            accept both; raw keys skip ASN.1 parsing on load but are not
+            readable by other tools.
         
     Returns:
         tuple: (private_key_path, public_key_path)
@@ -40,34 +45,126 @@ def generate_keys(output_dir=None, private_key_name="private_key.pem", public_ke
     
     # Save private key
     with open(private_key_path, "wb") as f:
-        f.write(private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        ))
+        if raw:
+            f.write(private_key.private_bytes_raw())
+        else:
+            f.write(private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            ))
     
     # Save public key
     with open(public_key_path, "wb") as f:
-        f.write(public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        ))
+        if raw:
+            f.write(public_key.public_bytes_raw())
+        else:
+            f.write(public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            ))
     
     return private_key_path, public_key_path
 
+def generate_keys_batch(count, output_dir=None, private_keys_name="private_keys.jsonl", public_keys_name="public_keys.jsonl"):
+    """
+    Generate several Ed25519 key pairs and save them as JSON lines.
+    
+    Private keys are stored as base64 PKCS8 DER, the form sign_challenge
+    accepts with is_base64=True. Public keys are stored as base64 raw 32-byte
+    keys, the form the backend example's /verify endpoint accepts. Each file
+    is written with a single write call.
+    
+    Args:
+        count (int): Number of key pairs to generate
+        output_dir (str): Directory to save keys (default: current directory)
+        private_keys_name (str): Filename for the private keys
+        public_keys_name (str): Filename for the public keys
+        
+    Returns:
+        tuple: (private_keys_path, public_keys_path)
+    """
+    # Set default output directory if not specified
+    if output_dir is None:
+        output_dir = os.getcwd()
+    
+    # Create output directory if it doesn't exist
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Draw every seed with one urandom call rather than one per key
+    seeds = os.urandom(32 * count)
+    
+    private_lines = []
+    public_lines = []
+    for index in range(count):
+        seed = seeds[index * 32:(index + 1) * 32]
+        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(seed)
+        private_der = private_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        public_raw = private_key.public_key().public_bytes_raw()
+        private_lines.append(json.dumps({
+            "index": index,
+            "private_key": base64.b64encode(private_der).decode("ascii")
+        }) + "\n")
+        public_lines.append(json.dumps({
+            "index": index,
+            "public_key": base64.b64encode(public_raw).decode("ascii")
+        }) + "\n")
+    
+    # Create paths
+    private_keys_path = os.path.join(output_dir, private_keys_name)
+    public_keys_path = os.path.join(output_dir, public_keys_name)
+    
+    with open(private_keys_path, "w") as f:
+        f.write("".join(private_lines))
+    
+    with open(public_keys_path, "w") as f:
+        f.write("".join(public_lines))
+    
+    return private_keys_path, public_keys_path
+
+def _positive_int(value):
+    """
+    argparse type for counts that must be at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="Generate Ed25519 key pair for Obolus authentication")
     parser.add_argument("--output-dir", help="Directory to save key files")
-    parser.add_argument("--private-key", default="private_key.pem", help="Filename for private key")
-    parser.add_argument("--public-key", default="public_key.pem", help="Filename for public key")
+    parser.add_argument("--private-key", help="Filename for private key (default: private_key.pem, or .raw with --raw)")
+    parser.add_argument("--public-key", help="Filename for public key (default: public_key.pem, or .raw with --raw)")
+    parser.add_argument("--raw", action="store_true",
+                        help="Write bare 32-byte keys instead of PEM (faster to load, Obolus-only)")
+    parser.add_argument("--batch", type=_positive_int, metavar="N",
+                        help="Generate N key pairs as base64 JSON lines (private_keys.jsonl, public_keys.jsonl)")
     
     args = parser.parse_args()
     
     try:
+        if args.batch is not None:
+            private_keys_path, public_keys_path = generate_keys_batch(args.batch, output_dir=args.output_dir)
+            print(f"✅ {args.batch} key pairs generated successfully")
+            print(f"   Private keys saved to: {private_keys_path}")
+            print(f"   Public keys saved to: {public_keys_path}")
+            print("\nIMPORTANT: Keep your private keys secure and never share them!")
+            return 0
+        
+        extension = "raw" if args.raw else "pem"
         private_key_path, public_key_path = generate_keys(
             output_dir=args.output_dir,
-            private_key_name=args.private_key,
-            public_key_name=args.public_key
+            private_key_name=args.private_key or f"private_key.{extension}",
+            public_key_name=args.public_key or f"public_key.{extension}",
+            raw=args.raw
         )
         
         print(f"✅ Keys generated successfully")
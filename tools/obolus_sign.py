@@ -3,7 +3,7 @@
 Obolus Sign - Command-line tool for signing Obolus challenges.
 
 Usage:
-  obolus-sign --key PRIVATE_KEY_FILE --challenge CHALLENGE_FILE [--action approved|rejected] [--output OUTPUT_FILE]
+  obolus-sign --key PRIVATE_KEY_FILE --challenge CHALLENGE_FILE [--action approved|rejected] [--output OUTPUT_FILE] [--pretty]
   obolus-sign --help
 
 Options:
@@ -11,6 +11,7 @@ Options:
   --challenge CHALLENGE_FILE  Path to challenge JSON file
   --action ACTION             Response action (approved or rejected) [default: approved]
   --output OUTPUT_FILE        Output file for signed response [default: stdout]
+  --pretty                    Pretty-print the response JSON [default: compact]
   --help                      Show this help message and exit
 """
 
@@ -18,6 +19,7 @@ import sys
 import os
 import json
 import argparse
+from datetime import datetime, timezone
 
 # Add parent directory to path so we can import core modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -37,19 +39,23 @@ def main():
     parser.add_argument("--action", choices=["approved", "rejected"], default="approved", 
                         help="Response action (approved or rejected)")
     parser.add_argument("--output", help="Output file for signed response (default: stdout)")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print the response JSON (default: compact)")
     
     # Parse arguments
     args = parser.parse_args()
     
     try:
         # Read challenge file
-        with open(args.challenge, 'r') as f:
+        with open(args.challenge, 'rb') as f:
             challenge_data = f.read()
         
         # Display challenge
         challenge = parse_challenge(challenge_data)
         display_challenge(challenge)
         
+        if datetime.now(timezone.utc) > challenge.expires_at_dt:
+            print(f"Warning: Challenge has expired at {challenge.expires_at_dt.isoformat()}", file=sys.stderr)
+        
         # Confirm action if interactive
         if sys.stdin.isatty() and sys.stdout.isatty():
             confirm = input(f"Do you want to {args.action} this challenge? [y/N] ")
@@ -58,11 +64,13 @@ def main():
                 return
         
         # Sign challenge
-        response_json = sign_challenge_to_json(challenge_data, args.key, args.action)
+        response_json = sign_challenge_to_json(
+            challenge_data, args.key, args.action, indent=2 if args.pretty else None
+        )
         
         # Output response
         if args.output:
-            with open(args.output, 'w') as f:
+            with open(args.output, 'w', encoding='utf-8') as f:
                 f.write(response_json)
             print(f"Response saved to {args.output}")
         else:
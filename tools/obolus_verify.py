@@ -40,10 +40,10 @@ def main():
     
     try:
         # Read challenge and response files
-        with open(args.challenge, 'r') as f:
+        with open(args.challenge, 'rb') as f:
             challenge_data = f.read()
         
-        with open(args.response, 'r') as f:
+        with open(args.response, 'rb') as f:
             response_data = f.read()
         
         # Display challenge